@@ -1,7 +1,6 @@
 import math
 import random
 import streamlit as st
-import io
 
 st.set_page_config(page_title="Class Tournament Brackets", layout="wide")
 
@@ -59,7 +58,6 @@ def get_tournament(tournament):
         data[tournament] = {
             "entrants": {c: ROSTERS[c][:] for c in CLASS_ORDER},
             "winners": {},
-            "notes": {},
         }
     return data[tournament]
 
@@ -151,8 +149,9 @@ def draw_match(tournament, tdata, mid, p1, p2, title):
         st.markdown(f"**{title}**")
         st.write(f"{p1} vs {p2}")
         if p1 == "BYE" or p2 == "BYE":
-            st.caption(f"Automatic winner: {match_winner(tdata, mid, p1, p2)}")
-            return match_winner(tdata, mid, p1, p2)
+            winner = match_winner(tdata, mid, p1, p2)
+            st.caption(f"Automatic winner: {winner}")
+            return winner
         if p1.startswith("Winner") or p2.startswith("Winner") or p1.startswith("TBD") or p2.startswith("TBD"):
             st.caption("Complete earlier matches first.")
             return ""
@@ -192,9 +191,6 @@ def draw_bracket_graph(rounds, class_name):
     lines.append(f"=== {class_name} Bracket Graph ===")
     lines.append("")
     
-    # Find max matches in any round for alignment
-    max_matches = max([len(matches) for matches in rounds]) if rounds else 0
-    
     for round_idx, matches in enumerate(rounds, start=1):
         padding = " " * (round_idx - 1) * 4
         lines.append(f"{padding}Round {round_idx}:")
@@ -210,8 +206,20 @@ def draw_bracket_graph(rounds, class_name):
     return "\n".join(lines)
 
 
-def generate_full_bracket_text(tournament, tdata):
+def build_class_brackets(tournament, tdata):
+    """Build the winners bracket for every class with enough players"""
+    brackets = {}
+    for class_name in CLASS_ORDER:
+        players = tdata["entrants"].get(class_name, [])
+        if len(players) >= 2:
+            brackets[class_name] = build_winners_bracket(tournament, class_name, players, tdata)
+    return brackets
+
+
+def generate_full_bracket_text(tournament, tdata, brackets=None):
     """Generate complete text representation of all brackets"""
+    if brackets is None:
+        brackets = build_class_brackets(tournament, tdata)
     output_parts = []
     output_parts.append(f"TOURNAMENT: {tournament}")
     output_parts.append("=" * 50)
@@ -220,13 +228,12 @@ def generate_full_bracket_text(tournament, tdata):
     class_champions = {}
     
     for class_name in CLASS_ORDER:
-        players = tdata["entrants"].get(class_name, [])
-        if len(players) < 2:
+        if class_name not in brackets:
             output_parts.append(f"{class_name}: Not enough players (need at least 2)")
             output_parts.append("")
             continue
         
-        rounds, champion = build_winners_bracket(tournament, class_name, players, tdata)
+        rounds, champion = brackets[class_name]
         output_parts.append(draw_bracket_tree(rounds, class_name))
         output_parts.append(draw_bracket_graph(rounds, class_name))
         output_parts.append(f"Class Champion: {champion if champion else 'TBD'}")
@@ -298,7 +305,8 @@ def draw_class_bracket(tournament, class_name, players, tdata):
     if losers_alive:
         lb_key = f"{class_name}|LB|winner"
         opts = [""] + losers_alive
-        idx = opts.index(tdata["winners"].get(lb_key, "")) if tdata["winners"].get(lb_key, "") in opts else 0
+        current = tdata["winners"].get(lb_key, "")
+        idx = opts.index(current) if current in opts else 0
         lb_winner = st.selectbox("Losers bracket winner", opts, idx, key=key_for(tournament, lb_key))
         if lb_winner:
             tdata["winners"][lb_key] = lb_winner
@@ -355,7 +363,8 @@ def display_bracket_visualization(tournament, tdata):
     # Create tabs for different visualization types
     viz_tabs = st.tabs(["Tree View", "Graph View", "Complete Text Export"])
     
-    full_text = generate_full_bracket_text(tournament, tdata)
+    brackets = build_class_brackets(tournament, tdata)
+    full_text = generate_full_bracket_text(tournament, tdata, brackets)
     
     with viz_tabs[0]:
         st.markdown("### Tree Structure")
@@ -378,23 +387,17 @@ def display_bracket_visualization(tournament, tdata):
         graph_output.append(f"TOURNAMENT: {tournament}")
         graph_output.append("=" * 50)
         
+        class_champions = {}
         for class_name in CLASS_ORDER:
-            players = tdata["entrants"].get(class_name, [])
-            if len(players) >= 2:
-                rounds, _ = build_winners_bracket(tournament, class_name, players, tdata)
+            if class_name in brackets:
+                rounds, champion = brackets[class_name]
                 graph_output.append(draw_bracket_graph(rounds, class_name))
+                class_champions[class_name] = champion if champion and not champion.startswith("Winner") and champion != "BYE" else ""
             else:
                 graph_output.append(f"{class_name}: Not enough players")
             graph_output.append("")
-        
+
         # Add overall finals info
-        class_champions = {}
-        for class_name in CLASS_ORDER:
-            players = tdata["entrants"].get(class_name, [])
-            if len(players) >= 2:
-                _, champion = build_winners_bracket(tournament, class_name, players, tdata)
-                class_champions[class_name] = champion if champion and not champion.startswith("Winner") and champion != "BYE" else ""
-        
         available = {c: p for c, p in class_champions.items() if p}
         if len(available) >= 3:
             graph_output.append("OVERALL FINALS:")